@@ -1,11 +1,15 @@
 # package marker for OASIS
 __version__ = "0.1"
 
-# Re-export commonly used API so "from OASIS import X" works for tests
-from .scrapers.osf_api import OSFPreprints
-from .scrapers.osf_elastic import ElasticPreprints
-from .scrapers.arxiv_scraper import scrape_arxiv
-from .utils import safe_request
+# Re-export commonly used API so "from OASIS import X" works for tests.
+# Resolved lazily (PEP 562): importing the package (which every entry
+# point does) must not pull in pandas/bs4 before the GUI is on screen.
+_LAZY_EXPORTS = {
+    "OSFPreprints": ".scrapers.osf_api",
+    "ElasticPreprints": ".scrapers.osf_elastic",
+    "scrape_arxiv": ".scrapers.arxiv_scraper",
+    "safe_request": ".utils",
+}
 
 __all__ = [
     "OSFPreprints",
@@ -14,3 +18,11 @@ __all__ = [
     "safe_request",
     "__version__",
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(module_path, __name__), name)
@@ -29,6 +29,9 @@ SERVERS = {
     "Thesis Commons": {"type": "osf", "display_name": "Thesis Commons", "provider": "thesiscommons"},
 }
 
+# OSF repositories offered as checkboxes in the GUI
+OSF_SELECTABLE_PROVIDERS = ["PsyArXiv", "SocArXiv", "LawArXiv"]
+
 OSF_PROVIDERS = {
     "psyarxiv": "PsyArXiv",
     "socarxiv": "SocArXiv",
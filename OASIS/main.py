@@ -2,11 +2,13 @@
 import sys
 import os
 from PyQt6.QtWidgets import QApplication, QMainWindow
-from .ui_main import OASISWidget
+from .ui_main import OASISWidget, APP_STYLESHEET
 
 def main():
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
+    # one app-level stylesheet; per-widget styling uses dynamic properties
+    app.setStyleSheet(APP_STYLESHEET)
 
     window = QMainWindow()
     oasis_widget = OASISWidget()
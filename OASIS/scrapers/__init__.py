@@ -1,6 +1,18 @@
-# scrapers package initializer
-from .arxiv_scraper import scrape_arxiv, parse_arxiv_page
-from .osf_api import OSFPreprints
-from .osf_elastic import ElasticPreprints
+# scrapers package initializer; re-exports resolve lazily (PEP 562) so
+# importing the package does not load every scraper's dependencies
+_LAZY_EXPORTS = {
+    "scrape_arxiv": ".arxiv_scraper",
+    "parse_arxiv_page": ".arxiv_scraper",
+    "OSFPreprints": ".osf_api",
+    "ElasticPreprints": ".osf_elastic",
+}
 
 __all__ = ["scrape_arxiv", "parse_arxiv_page", "OSFPreprints", "ElasticPreprints"]
+
+
+def __getattr__(name):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(module_path, __name__), name)
@@ -1,98 +1,217 @@
 # OSF Elastic (weblike) search implementation (uses share.osf elastic endpoint)
 import re
+import json
+import time
+import random
+import atexit
+import logging
+import threading
 import pandas as pd
 import httpx
 
-from ..utils import safe_request
+from ..utils import safe_request, cache_get, cache_put, json_loads, HAS_PYARROW, RETRY_STATUSES
 from ..config import OSF_ELASTIC_URL, POLITENESS_CONFIG, OSF_PROVIDERS
 
+try:
+    # optional; enables stream-parsing of large pages so hit construction
+    # starts before the body finishes arriving and peak RAM stays ~one hit
+    import ijson
+except ImportError:
+    ijson = None
+
+# one alternation pattern plus a dispatch table replaces the chain of
+# per-operator substitutions, so normalization is a single engine pass
+_QUERY_TOKEN_RE = re.compile(r"\b(?:and|or|not)\b|[|&]", re.IGNORECASE)
+_QUERY_TOKEN_MAP = {"and": " AND ", "or": " OR ", "not": " NOT ", "|": " OR ", "&": " AND "}
+_WS_RE = re.compile(r"\s+")
+
+# fixed column order for the result frame
+COLUMNS = ("ID", "Title", "Abstract", "Date Published", "Tags", "DOI", "URL", "Contributors", "Provider")
+
+# lazy module-level client shared by every ElasticPreprints instance: the
+# DNS lookup, TCP handshake and TLS/ALPN negotiation happen once per
+# session instead of once per search (httpx.Client is thread-safe)
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_elastic_client():
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                # HTTP/2 + keepalive so every page of a scrape reuses one TLS session
+                _CLIENT = httpx.Client(headers={"User-Agent": "Mozilla/5.0"}, timeout=30.0,
+                                       http2=True,
+                                       limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0))
+                atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+class _IterReader:
+    """Minimal read()-only file adapter over an httpx byte-chunk iterator."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buf = b""
+
+    def read(self, n=-1):
+        if n < 0:
+            return self._buf + b"".join(self._chunks)
+        while len(self._buf) < n:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buf += chunk
+        out, self._buf = self._buf[:n], self._buf[n:]
+        return out
+
+
 class ElasticPreprints:
     def __init__(self, provider="psyarxiv", politeness="Normal"):
         self.provider = provider
-        self.client = httpx.Client(headers={"User-Agent": "Mozilla/5.0"}, timeout=30.0)
+        self.client = get_elastic_client()
         self.abort_flag = False
         self.politeness = politeness
 
+    def _fetch_hits(self, payload, retries, politeness_delay):
+        """POST one Elastic page and return its hits list.
+
+        With ijson available the response body is stream-parsed as it
+        arrives, so hit dicts materialize one at a time instead of after a
+        full multi-MB body buffer; otherwise fall back to the buffered path.
+        """
+        if ijson is None:
+            res = safe_request("POST", OSF_ELASTIC_URL, client=self.client, json=payload, retries=retries, backoff_factor=2, politeness_delay=politeness_delay)
+            data = json_loads(res.content)
+            return data.get("hits", {}).get("hits", [])
+
+        # client.stream cannot go through safe_request (it buffers the body),
+        # so the same retry/backoff policy is applied around the stream here
+        attempt = 0
+        while True:
+            try:
+                with self.client.stream("POST", OSF_ELASTIC_URL, json=payload) as res:
+                    if res.status_code in RETRY_STATUSES:
+                        wait = (2 ** attempt) + random.uniform(0, 1)
+                        logging.warning(f"{res.status_code} received for {OSF_ELASTIC_URL}. Backing off {wait:.1f}s (attempt {attempt + 1}/{retries}).")
+                        time.sleep(wait)
+                        attempt += 1
+                        if attempt >= retries:
+                            res.raise_for_status()
+                        continue
+                    res.raise_for_status()
+                    # use_float keeps values JSON-serializable for the cache
+                    hits = list(ijson.items(_IterReader(res.iter_bytes()), "hits.hits.item", use_float=True))
+                if politeness_delay and politeness_delay > 0:
+                    time.sleep(politeness_delay)
+                return hits
+            except httpx.RequestError as e:
+                wait = (2 ** attempt) + random.uniform(0, 1)
+                logging.warning(f"Request error: {e}. Retrying in {wait:.1f}s (attempt {attempt + 1}/{retries}).")
+                time.sleep(wait)
+                attempt += 1
+                if attempt >= retries:
+                    raise
+
     def normalize_query(self, query: str) -> str:
         if not query:
             return query
-        query = query.replace("|", " OR ").replace("&", " AND ")
-        query = re.sub(r"\band\b", "AND", query, flags=re.IGNORECASE)
-        query = re.sub(r"\bor\b", "OR", query, flags=re.IGNORECASE)
-        query = re.sub(r"\bnot\b", "NOT", query, flags=re.IGNORECASE)
-        query = re.sub(r"\s+", " ", query).strip()
-        return query
+        query = _QUERY_TOKEN_RE.sub(lambda m: _QUERY_TOKEN_MAP[m.group(0).lower()], query)
+        return _WS_RE.sub(" ", query).strip()
 
     def run(self, query, progress_callback=None):
-        rows = []
+        # column-oriented accumulation: one list per column rather than one
+        # dict per hit, handed to pd.DataFrame in a single constructor call
+        cols = {col: [] for col in COLUMNS}
+        # dedup at ingestion: one set lookup per hit instead of a pandas
+        # drop_duplicates hash pass over the finished frame
+        seen_ids = set()
         size = 200
-        start = 0
 
         query = self.normalize_query(query)
 
         politeness_delay = POLITENESS_CONFIG.get(self.politeness, POLITENESS_CONFIG["Normal"])["osf_delay"]
         retries = POLITENESS_CONFIG.get(self.politeness, POLITENESS_CONFIG["Normal"])["retries"]
 
+        # cursor pagination (search_after) instead of from/size offsets: deep
+        # offsets make Elasticsearch re-materialize start+size hits per page
+        # and are capped by index.max_result_window (default 10000)
+        payload = {
+            "query": {
+                "bool": {
+                    "must": {
+                        "query_string": {
+                            "query": query,
+                            "fields": ["*"],
+                            "lenient": True
+                        }
+                    },
+                    "filter": [
+                        {"terms": {"sources": [OSF_PROVIDERS.get(self.provider, self.provider)]}},
+                        {"terms": {"types": ["preprint"]}}
+                    ]
+                }
+            },
+            "sort": [{"date_published": "desc"}, {"_id": "asc"}],
+            "size": size
+        }
+
         while True:
             if self.abort_flag:
                 break
 
-            payload = {
-                "query": {
-                    "bool": {
-                        "must": {
-                            "query_string": {
-                                "query": query,
-                                "fields": ["*"],
-                                "lenient": True
-                            }
-                        },
-                        "filter": [
-                            {"terms": {"sources": [OSF_PROVIDERS.get(self.provider, self.provider)]}},
-                            {"terms": {"types": ["preprint"]}}
-                        ]
-                    }
-                },
-                "from": start,
-                "size": size
-            }
-
-            res = safe_request("POST", OSF_ELASTIC_URL, client=self.client, json=payload, retries=retries, backoff_factor=2, politeness_delay=politeness_delay)
-            data = res.json()
-            hits = data.get("hits", {}).get("hits", [])
+            # keyed on the serialized payload, so the query, filters and
+            # search_after cursor all participate in the cache key; only the
+            # hits list is cached, the rest of the envelope is never used
+            cache_key = f"osf_elastic_hits|{json.dumps(payload, sort_keys=True)}"
+            hits = cache_get(cache_key)
+            if hits is None:
+                hits = self._fetch_hits(payload, retries, politeness_delay)
+                cache_put(cache_key, hits)
             if not hits:
                 break
 
             for h in hits:
                 if self.abort_flag:
                     break
-                s = h.get("_source", {})
+                # bind the _source dict's get once per hit instead of chaining
+                # fresh lookups for every field
+                s_get = h.get("_source", {}).get
+                hit_id = s_get("id", "")
+                if hit_id in seen_ids:
+                    continue
+                seen_ids.add(hit_id)
                 contributors = []
-                lists_contribs = s.get("lists", {}).get("contributors", []) if isinstance(s.get("lists", {}).get("contributors", []), list) else []
-                for c in lists_contribs:
-                    name = c.get("name")
-                    if name:
-                        contributors.append(name)
-                rows.append({
-                    "ID": s.get("id", ""),
-                    "Title": s.get("title", ""),
-                    "Abstract": s.get("description", ""),
-                    "Date Published": s.get("date_published", ""),
-                    "Tags": ",".join(s.get("tags", []) if isinstance(s.get("tags", []), list) else []),
-                    "DOI": s.get("doi", ""),
-                    "URL": s.get("links", {}).get("html", ""),
-                    "Contributors": ", ".join(contributors),
-                    "Provider": self.provider,
-                })
+                lists_contribs = (s_get("lists") or {}).get("contributors")
+                if isinstance(lists_contribs, list):
+                    for c in lists_contribs:
+                        name = c.get("name")
+                        if name:
+                            contributors.append(name)
+                tags = s_get("tags")
+                cols["ID"].append(hit_id)
+                cols["Title"].append(s_get("title", ""))
+                cols["Abstract"].append(s_get("description", ""))
+                cols["Date Published"].append(s_get("date_published", ""))
+                cols["Tags"].append(",".join(map(str, tags)) if isinstance(tags, list) else "")
+                cols["DOI"].append(s_get("doi", ""))
+                cols["URL"].append((s_get("links") or {}).get("html", ""))
+                cols["Contributors"].append(", ".join(contributors))
+                cols["Provider"].append(self.provider)
 
             if progress_callback:
-                progress_callback.emit(f"Fetched {len(rows)} results so far...")
+                progress_callback.emit(f"Fetched {len(cols['ID'])} results so far...")
 
-            start += size
-            if len(hits) < size:
+            last_sort = hits[-1].get("sort")
+            if len(hits) < size or not last_sort:
                 break
+            payload["search_after"] = last_sort
 
-        df = pd.DataFrame(rows)
-        if "ID" not in df.columns:
-            df["ID"] = ""
-        return df.drop_duplicates(subset="ID")
+        # IDs were deduplicated at ingestion, so no drop_duplicates pass here
+        df = pd.DataFrame(cols, copy=False)
+        # Provider is one value repeated per row; category stores it once
+        astype_map = {"Provider": "category"}
+        if HAS_PYARROW:
+            astype_map.update({col: "string[pyarrow]" for col in ("ID", "Tags", "DOI")})
+        return df.astype(astype_map)
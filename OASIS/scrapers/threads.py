@@ -4,6 +4,7 @@ import pandas as pd
 import logging
 
 from ..config import SERVERS
+from ..utils import HAS_PYARROW
 from ..scrapers.arxiv_scraper import scrape_arxiv
 from ..scrapers.osf_api import OSFPreprints
 from ..scrapers.osf_elastic import ElasticPreprints
@@ -13,7 +14,7 @@ class ScraperThread(QThread):
     finished = pyqtSignal(pd.DataFrame)
     error = pyqtSignal(str)
 
-    def __init__(self, server_config, query, search_mode, conditions=None, url=None, politeness="Normal"):
+    def __init__(self, server_config, query, search_mode, conditions=None, url=None, politeness="Normal", fetch_contributors=False):
         super().__init__()
         self.server_config = server_config
         self.query = query
@@ -23,6 +24,7 @@ class ScraperThread(QThread):
         self.client = None
         self.abort_flag = False
         self.politeness = politeness
+        self.fetch_contributors = fetch_contributors
 
     def run(self):
         try:
@@ -65,7 +67,7 @@ class ScraperThread(QThread):
             else:
                 provider = self.server_config["provider"]
                 if self.search_mode == "api":
-                    self.client = OSFPreprints(provider=provider, politeness=self.politeness)
+                    self.client = OSFPreprints(provider=provider, politeness=self.politeness, fetch_contributors=self.fetch_contributors)
                 else:
                     self.client = ElasticPreprints(provider=provider, politeness=self.politeness)
 
@@ -83,3 +85,27 @@ class ScraperThread(QThread):
         self.abort_flag = True
         if self.client:
             self.client.abort_flag = True
+
+class CSVWriterThread(QThread):
+    """Writes a result DataFrame to CSV off the GUI thread."""
+    done = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, df, path):
+        super().__init__()
+        self.df = df
+        self.path = path
+
+    def run(self):
+        try:
+            if HAS_PYARROW:
+                # pyarrow's C++ writer is several times faster than pandas'
+                # Python-level row formatter on text-heavy frames
+                import pyarrow as pa
+                from pyarrow import csv as pacsv
+                pacsv.write_csv(pa.Table.from_pandas(self.df, preserve_index=False), self.path)
+            else:
+                self.df.to_csv(self.path, index=False, chunksize=10_000, lineterminator="\n")
+            self.done.emit(self.path)
+        except Exception as e:
+            self.error.emit(str(e))
@@ -5,42 +5,92 @@ import logging
 import webbrowser
 from datetime import datetime
 
-import pandas as pd
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTextEdit, QComboBox, QRadioButton, QButtonGroup, QMessageBox,
     QGroupBox, QTabWidget, QFrame, QGridLayout, QCheckBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker
 from PyQt6.QtGui import QPixmap, QIcon, QMovie
 
-from .config import SERVERS, POLITENESS_CONFIG
-from .utils import unique_filename
-from .scrapers.threads import ScraperThread
+from .config import SERVERS, POLITENESS_CONFIG, OSF_SELECTABLE_PROVIDERS
+from .utils import unique_filename, clear_cache
+
+# pasted-URL normalization patterns, compiled once at import
+_SIZE_RE = re.compile(r"size=\d+")
+_ORDER_RE = re.compile(r"order=[^&]+")
+
+# application-wide stylesheet, installed once on the QApplication in main();
+# the dynamic-property selector styles every "?" info label without Qt
+# re-parsing the same CSS per widget
+APP_STYLESHEET = """
+QLabel[infoLabel="true"] {
+    border: 1px solid #888;
+    border-radius: 8px;
+    color: #555;
+    font-weight: bold;
+    font-family: Arial;
+    font-size: 11px;
+    min-width: 16px;
+    min-height: 16px;
+    max-width: 16px;
+    max-height: 16px;
+    text-align: center;
+    qproperty-alignment: 'AlignCenter';
+}
+QLabel[infoLabel="true"]:hover {
+    background-color: #e0e0e0;
+}
+"""
+
+# field lists fetched from config once at import; addItems copies them into
+# the combobox model, so there is no need to rebuild the list per row
+_ARXIV_FIELDS = tuple(SERVERS.get("ArXiv", {}).get("fields", ["all"]))
+_OSF_FIELDS = tuple(SERVERS.get("OSF", {}).get("fields", ["title", "abstract", "keywords"]))
+
+class ConditionRowManager:
+    """Owns one grid of operator/field/term rows; shared by the ArXiv and OSF tabs."""
+
+    def __init__(self, grid_layout, fields):
+        self.layout = grid_layout
+        self.fields = fields
+        self.rows = []
+
+    def add(self):
+        row_index = len(self.rows) + 1
+        op = QComboBox()
+        op.addItems(["AND", "OR"])
+        if not self.rows:
+            op.setEnabled(False)
+        field = QComboBox()
+        field.addItems(self.fields)
+        value = QLineEdit()
+        value.setPlaceholderText("Enter search term...")
+        label = QLabel(f"{row_index}.")
+        self.layout.addWidget(label, row_index, 0)
+        self.layout.addWidget(op, row_index, 1)
+        self.layout.addWidget(field, row_index, 2)
+        self.layout.addWidget(value, row_index, 3)
+        # label handle kept so remove() is O(1) instead of scanning the grid
+        self.rows.append({"label": label, "operator": op, "field": field, "value": value})
+
+    def remove(self):
+        if not self.rows:
+            return
+        last = self.rows.pop()
+        for widget in last.values():
+            widget.deleteLater()
+
 
 class OASISWidget(QWidget):
+    # scaled logo cached across instances; Qt's implicit sharing keeps reuse zero-copy
+    _LOGO_PIXMAP = None
+    # shared null icon for clearing the run button, avoids a fresh QIcon per reset
+    _NULL_ICON = QIcon()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.info_style = """
-        QLabel {
-            border: 1px solid #888;
-            border-radius: 8px;
-            color: #555;
-            font-weight: bold;
-            font-family: Arial;
-            font-size: 11px;
-            min-width: 16px;
-            min-height: 16px;
-            max-width: 16px;
-            max-height: 16px;
-            text-align: center;
-            qproperty-alignment: 'AlignCenter';
-        }
-        QLabel:hover {
-            background-color: #e0e0e0;
-        }
-        """
         # logging per-session file
         os.makedirs("logs", exist_ok=True)
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -62,10 +112,14 @@ class OASISWidget(QWidget):
         # Header area
         header_layout = QHBoxLayout()
         self.logo_label = QLabel()
-        pixmap = QPixmap("var/OASIS.png")
-        if not pixmap.isNull():
-            scaled_pixmap = pixmap.scaledToHeight(60, Qt.TransformationMode.SmoothTransformation)
-            self.logo_label.setPixmap(scaled_pixmap)
+        if OASISWidget._LOGO_PIXMAP is None:
+            pixmap = QPixmap("var/OASIS.png")
+            if not pixmap.isNull() and pixmap.height() != 60:
+                # smooth resample happens once; later constructions reuse the result
+                pixmap = pixmap.scaledToHeight(60, Qt.TransformationMode.SmoothTransformation)
+            OASISWidget._LOGO_PIXMAP = pixmap
+        if not OASISWidget._LOGO_PIXMAP.isNull():
+            self.logo_label.setPixmap(OASISWidget._LOGO_PIXMAP)
         header = QLabel("OASIS — Open ArXiv Scraper for Implementing Systematic Reviews")
         header.setStyleSheet("font-size: 16px; font-weight: bold;")
         header_layout.addWidget(self.logo_label)
@@ -80,7 +134,7 @@ class OASISWidget(QWidget):
 
         server_label = QLabel("Server:")
         server_info = QLabel("?")
-        server_info.setStyleSheet(self.info_style)
+        server_info.setProperty("infoLabel", True)
         server_info.setToolTip("Choose which preprint server to search.")
         # Replace dropdown with radio buttons
         self.server_button_group = QButtonGroup(self)
@@ -93,32 +147,32 @@ class OASISWidget(QWidget):
         self.arxiv_radio.toggled.connect(lambda checked: self.server_changed("ArXiv") if checked else None)
         self.osf_radio.toggled.connect(lambda checked: self.server_changed("OSF") if checked else None)
 
-        # OSF repositories presented horizontally as checkboxes (hidden for ArXiv)
+        # OSF repositories presented horizontally as checkboxes (hidden for ArXiv);
+        # the checkboxes themselves are built lazily on first switch to OSF
         self.osf_repo_widget = QWidget()
-        osf_repo_layout = QHBoxLayout(self.osf_repo_widget)
-        osf_repo_layout.setContentsMargins(0, 0, 0, 0)
+        self.osf_repo_layout = QHBoxLayout(self.osf_repo_widget)
+        self.osf_repo_layout.setContentsMargins(0, 0, 0, 0)
+        # stored as (name, checkbox) pairs so selection avoids cb.text() marshals
         self.osf_server_checks = []
-        # default list kept as before
-        osf_providers = ["PsyArXiv", "SocArXiv", "LawArXiv"]
-        for name in osf_providers:
-            cb = QCheckBox(name)
-            cb.setChecked(False)
-            self.osf_server_checks.append(cb)
-            osf_repo_layout.addWidget(cb)
-        osf_repo_layout.addStretch()
 
         # Strategy (for OSF only)
         self.strategy_label = QLabel("Strategy:")
         self.strategy_info = QLabel("?")
-        self.strategy_info.setStyleSheet(self.info_style)
+        self.strategy_info.setProperty("infoLabel", True)
         self.strategy_info.setToolTip("Choose whether to use the OSF API (title search only) or the Weblike search (title, abstract, and keywords).")
         self.standard_radio = QRadioButton("OSF API")
         self.comprehensive_radio = QRadioButton("Weblike API")
         self.standard_radio.setChecked(True)
 
+        # opt-in: one extra request per preprint, so a large API-mode scrape
+        # takes many times longer with this enabled
+        self.fetch_contribs_check = QCheckBox("Fetch contributors")
+        self.fetch_contribs_check.setChecked(False)
+        self.fetch_contribs_check.setToolTip("Look up contributor names for each preprint (OSF API mode only). Adds one request per preprint, so large searches take much longer.")
+
         politeness_label = QLabel("Politeness:")
         politeness_info = QLabel("?")
-        politeness_info.setStyleSheet(self.info_style)
+        politeness_info.setProperty("infoLabel", True)
         politeness_info.setToolTip("Choose the frequency of requests, faster requests may result in rate limiting.")
         self.politeness_combo = QComboBox()
         self.politeness_combo.addItems(list(POLITENESS_CONFIG.keys()))
@@ -143,6 +197,7 @@ class OASISWidget(QWidget):
         config_layout.addWidget(self.strategy_info)
         config_layout.addWidget(self.standard_radio)
         config_layout.addWidget(self.comprehensive_radio)
+        config_layout.addWidget(self.fetch_contribs_check)
         config_layout.addStretch()
         config_layout.addWidget(politeness_label)
         config_layout.addWidget(politeness_info)
@@ -174,13 +229,17 @@ class OASISWidget(QWidget):
 
         filename_label = QLabel("Filename base:")
         filename_info = QLabel("?")
-        filename_info.setStyleSheet(self.info_style)
+        filename_info.setProperty("infoLabel", True)
         filename_info.setToolTip("Output file name")
         self.filename_input = QLineEdit("OASIS_search")
 
         self.preview_button = QPushButton("Preview URL")
         self.preview_button.clicked.connect(self.preview_url)
 
+        self.clear_cache_button = QPushButton("Clear Cache")
+        self.clear_cache_button.setToolTip("Delete cached OSF responses (reused for up to 24h).")
+        self.clear_cache_button.clicked.connect(self.clear_response_cache)
+
         self.run_button = QPushButton("Start Search")
         self.run_button.setObjectName("runButton")
 
@@ -195,6 +254,7 @@ class OASISWidget(QWidget):
         action_layout.addWidget(filename_info)
         action_layout.addWidget(self.filename_input)
         action_layout.addStretch()
+        action_layout.addWidget(self.clear_cache_button)
         action_layout.addWidget(self.preview_button)
         action_layout.addWidget(self.run_button)
         action_layout.addWidget(self.abort_button)
@@ -245,11 +305,14 @@ class OASISWidget(QWidget):
 
         cond_layout.addWidget(self.condition_rows_widget)
 
+        self.arxiv_conditions = ConditionRowManager(self.condition_rows_layout, _ARXIV_FIELDS)
+        self.condition_rows = self.arxiv_conditions.rows
+
         btn_layout = QHBoxLayout()
         self.add_condition_button = QPushButton("➕ Add Term")
         self.remove_condition_button = QPushButton("➖ Remove Term")
-        self.add_condition_button.clicked.connect(self.add_condition_row)
-        self.remove_condition_button.clicked.connect(self.remove_condition_row)
+        self.add_condition_button.clicked.connect(self.arxiv_conditions.add)
+        self.remove_condition_button.clicked.connect(self.arxiv_conditions.remove)
         btn_layout.addWidget(self.add_condition_button)
         btn_layout.addWidget(self.remove_condition_button)
         btn_layout.addStretch()
@@ -257,15 +320,14 @@ class OASISWidget(QWidget):
         cond_group.setLayout(cond_layout)
         layout.addWidget(cond_group)
 
-        self.condition_rows = []
-        self.add_condition_row()
+        self.arxiv_conditions.add()
 
     def setup_arxiv_paste_query_tab(self):
         layout = QVBoxLayout(self.arxiv_paste_query_tab)
         group = QGroupBox("Paste ArXiv Query")
         g_l = QVBoxLayout()
         info = QLabel("?")
-        info.setStyleSheet(self.info_style)
+        info.setProperty("infoLabel", True)
         info.setToolTip("Paste an ArXiv query string (e.g., advanced query parts) to be used directly for searching.")
         self.paste_query_text = QTextEdit()
         self.paste_query_text.setMaximumHeight(80)
@@ -280,7 +342,7 @@ class OASISWidget(QWidget):
         group = QGroupBox("Paste ArXiv Advanced Search URL")
         g_l = QVBoxLayout()
         info = QLabel("?")
-        info.setStyleSheet(self.info_style)
+        info.setProperty("infoLabel", True)
         info.setToolTip("Paste a complete ArXiv advanced search URL. The tool will optimise it for systematic extraction.")
         self.paste_url_text = QTextEdit()
         self.paste_url_text.setMaximumHeight(80)
@@ -314,11 +376,14 @@ class OASISWidget(QWidget):
 
         cond_layout.addWidget(self.osf_condition_rows_widget)
 
+        self.osf_conditions = ConditionRowManager(self.osf_condition_rows_layout, _OSF_FIELDS)
+        self.osf_condition_rows = self.osf_conditions.rows
+
         btn_layout = QHBoxLayout()
         self.osf_add_condition_button = QPushButton("➕ Add Term")
         self.osf_remove_condition_button = QPushButton("➖ Remove Term")
-        self.osf_add_condition_button.clicked.connect(self.add_osf_condition_row)
-        self.osf_remove_condition_button.clicked.connect(self.remove_osf_condition_row)
+        self.osf_add_condition_button.clicked.connect(self.osf_conditions.add)
+        self.osf_remove_condition_button.clicked.connect(self.osf_conditions.remove)
         btn_layout.addWidget(self.osf_add_condition_button)
         btn_layout.addWidget(self.osf_remove_condition_button)
         btn_layout.addStretch()
@@ -326,15 +391,14 @@ class OASISWidget(QWidget):
         cond_group.setLayout(cond_layout)
         build_layout.addWidget(cond_group)
 
-        self.osf_condition_rows = []
-        self.add_osf_condition_row()
+        self.osf_conditions.add()
 
         # Free text / paste tab
         free_layout = QVBoxLayout(self.osf_free_tab)
         group = QGroupBox("OSF Free Text Query")
         g_l = QVBoxLayout()
         info = QLabel("?")
-        info.setStyleSheet(self.info_style)
+        info.setProperty("infoLabel", True)
         info.setToolTip("Enter search terms. OSF API searches titles only; Weblike uses titles, abstracts, and keywords.")
         self.osf_query_input = QTextEdit()
         self.osf_query_input.setMaximumHeight(80)
@@ -344,64 +408,16 @@ class OASISWidget(QWidget):
         group.setLayout(g_l)
         free_layout.addWidget(group)
 
-    def add_condition_row(self):
-        row_index = len(self.condition_rows) + 1
-        op = QComboBox()
-        op.addItems(["AND", "OR"])
-        if len(self.condition_rows) == 0:
-            op.setEnabled(False)
-        field = QComboBox()
-        field.addItems(SERVERS.get("ArXiv", {}).get("fields", ["all"]))
-        value = QLineEdit()
-        value.setPlaceholderText("Enter search term...")
-        self.condition_rows_layout.addWidget(QLabel(f"{len(self.condition_rows) + 1}."), row_index, 0)
-        self.condition_rows_layout.addWidget(op, row_index, 1)
-        self.condition_rows_layout.addWidget(field, row_index, 2)
-        self.condition_rows_layout.addWidget(value, row_index, 3)
-        self.condition_rows.append({"operator": op, "field": field, "value": value})
-
-    def remove_condition_row(self):
-        if not self.condition_rows:
+    def _ensure_osf_repo_checks(self):
+        # built on first entry into OSF mode to keep widgets off the startup path
+        if self.osf_server_checks:
             return
-        last = self.condition_rows.pop()
-        last["operator"].deleteLater()
-        last["field"].deleteLater()
-        last["value"].deleteLater()
-        for i in reversed(range(self.condition_rows_layout.count())):
-            w = self.condition_rows_layout.itemAt(i).widget()
-            if isinstance(w, QLabel) and w.text() == f"{len(self.condition_rows) + 1}.":
-                w.deleteLater()
-                break
-
-    def add_osf_condition_row(self):
-        row_index = len(self.osf_condition_rows) + 1
-        op = QComboBox()
-        op.addItems(["AND", "OR"])
-        if len(self.osf_condition_rows) == 0:
-            op.setEnabled(False)
-        # use OSF-specific fields if present in config, otherwise sensible defaults
-        field = QComboBox()
-        field.addItems(SERVERS.get("OSF", {}).get("fields", ["title", "abstract", "keywords"]))
-        value = QLineEdit()
-        value.setPlaceholderText("Enter search term...")
-        self.osf_condition_rows_layout.addWidget(QLabel(f"{len(self.osf_condition_rows) + 1}."), row_index, 0)
-        self.osf_condition_rows_layout.addWidget(op, row_index, 1)
-        self.osf_condition_rows_layout.addWidget(field, row_index, 2)
-        self.osf_condition_rows_layout.addWidget(value, row_index, 3)
-        self.osf_condition_rows.append({"operator": op, "field": field, "value": value})
-
-    def remove_osf_condition_row(self):
-        if not self.osf_condition_rows:
-            return
-        last = self.osf_condition_rows.pop()
-        last["operator"].deleteLater()
-        last["field"].deleteLater()
-        last["value"].deleteLater()
-        for i in reversed(range(self.osf_condition_rows_layout.count())):
-            w = self.osf_condition_rows_layout.itemAt(i).widget()
-            if isinstance(w, QLabel) and w.text() == f"{len(self.osf_condition_rows) + 1}.":
-                w.deleteLater()
-                break
+        for name in OSF_SELECTABLE_PROVIDERS:
+            cb = QCheckBox(name)
+            cb.setChecked(False)
+            self.osf_server_checks.append((name, cb))
+            self.osf_repo_layout.addWidget(cb)
+        self.osf_repo_layout.addStretch()
 
     def server_changed(self, server_name):
         self.current_server = server_name
@@ -413,12 +429,16 @@ class OASISWidget(QWidget):
             self.strategy_info.setVisible(False)
             self.standard_radio.setVisible(False)
             self.comprehensive_radio.setVisible(False)
-            # arXiv tabs: Build, Paste Query, Paste URL visible; OSF tab hidden
-            self.tabs.setTabVisible(0, True)
-            self.tabs.setTabVisible(1, True)
-            self.tabs.setTabVisible(2, True)
-            self.tabs.setTabVisible(3, False)
-            self.tabs.setCurrentIndex(0)
+            self.fetch_contribs_check.setVisible(False)
+            # arXiv tabs: Build, Paste Query, Paste URL visible; OSF tab hidden.
+            # Blocker suppresses the intermediate currentChanged/visibility
+            # signals while the tab set is rearranged wholesale.
+            with QSignalBlocker(self.tabs):
+                self.tabs.setTabVisible(0, True)
+                self.tabs.setTabVisible(1, True)
+                self.tabs.setTabVisible(2, True)
+                self.tabs.setTabVisible(3, False)
+                self.tabs.setCurrentIndex(0)
             # preview useful for build query; keep visible for Build Query
             self.preview_button.setVisible(True)
             self.osf_repo_widget.setVisible(False)
@@ -429,17 +449,24 @@ class OASISWidget(QWidget):
             self.strategy_info.setVisible(True)
             self.standard_radio.setVisible(True)
             self.comprehensive_radio.setVisible(True)
+            self.fetch_contribs_check.setVisible(True)
             # Only show OSF tab
-            self.tabs.setTabVisible(0, False)
-            self.tabs.setTabVisible(1, False)
-            self.tabs.setTabVisible(2, False)
-            self.tabs.setTabVisible(3, True)
-            self.tabs.setCurrentIndex(3)
+            with QSignalBlocker(self.tabs):
+                self.tabs.setTabVisible(0, False)
+                self.tabs.setTabVisible(1, False)
+                self.tabs.setTabVisible(2, False)
+                self.tabs.setTabVisible(3, True)
+                self.tabs.setCurrentIndex(3)
             self.preview_button.setVisible(False)
+            self._ensure_osf_repo_checks()
             self.osf_repo_widget.setVisible(True)
 
 
     def run_scraper(self):
+        # deferred: ScraperThread drags in pandas/httpx/bs4, which would
+        # otherwise dominate GUI cold-start time
+        from .scrapers.threads import ScraperThread
+
         server_config = SERVERS.get(self.current_server, {"type": "arxiv"})
         base_filename = self.filename_input.text().strip() or "OASIS_search"
         politeness = self.politeness_combo.currentText()
@@ -469,8 +496,8 @@ class OASISWidget(QWidget):
                         self._reset_run_button()
                         return
 
-                    constructed_terms = " ".join([f"{c['operator']} {c['value']}" if i != 0 else c['value']
-                                                  for i, c in enumerate(conditions)])
+                    constructed_terms = conditions[0]['value'] + "".join(
+                        f" {c['operator']} {c['value']}" for c in conditions[1:])
                     logging.info(f"Starting ArXiv Build Query search (conditions: {constructed_terms})")
                     log_query_str = constructed_terms
 
@@ -505,9 +532,9 @@ class OASISWidget(QWidget):
                         QMessageBox.warning(self, "Input Error", "Please paste a valid ArXiv search URL.")
                         self._reset_run_button()
                         return
-                    url = re.sub(r"size=\d+", f"size={200}", url)
+                    url = _SIZE_RE.sub(f"size={200}", url)
                     if "order=" in url:
-                        url = re.sub(r"order=[^&]+", f"order={'-announced_date_first'}", url)
+                        url = _ORDER_RE.sub(f"order={'-announced_date_first'}", url)
                     else:
                         url += f"&order={'-announced_date_first'}"
                     logging.info(f"Starting ArXiv Paste URL search. URL: {url}")
@@ -554,74 +581,99 @@ class OASISWidget(QWidget):
                     search_mode = "api" if self.standard_radio.isChecked() else "weblike"
                     query_payload = query
 
-                selected_providers = [cb.text()
-                                      for cb in self.osf_server_checks
+                selected_providers = [name
+                                      for name, cb in self.osf_server_checks
                                       if cb.isChecked()]
                 if not selected_providers:
                     QMessageBox.warning(self, "Input Error", "Select at least one OSF server.")
                     self._reset_run_button()
                     return
 
-                # run sequential searches for each selected provider
-                self.all_results = pd.DataFrame()
+                # providers are independent, so their searches run in parallel;
+                # _collect_and_continue counts them back in and saves once
+                self._result_frames = []
+                self._pending_providers = len(selected_providers)
+                self._osf_workers = []
                 for prov_name in selected_providers:
                     prov_config = SERVERS.get(prov_name)
                     logging.info(f"Starting OSF search on provider={prov_name}, mode={search_mode}")
                     self.feedback_text.append(f"\n🔍 Searching {prov_name}...\n")
                     # pass conditions when build_query, else pass string query
-                    kwargs = dict(server_config=prov_config, query=query_payload, search_mode=search_mode, politeness=politeness)
+                    kwargs = dict(server_config=prov_config, query=query_payload, search_mode=search_mode, politeness=politeness,
+                                  fetch_contributors=self.fetch_contribs_check.isChecked())
                     if use_build:
                         kwargs["conditions"] = query_payload
                     worker = ScraperThread(**kwargs)
-                    # connect ephemeral signals synchronously via blocking run in thread
                     worker.progress.connect(self.update_progress)
                     worker.finished.connect(lambda df, p=prov_name: self._collect_and_continue(df, p, base_filename, search_mode))
-                    worker.error.connect(self.scraper_error)
+                    worker.error.connect(lambda msg, p=prov_name: self._provider_failed(msg, p, base_filename))
+                    # keep a reference so the QThread isn't garbage collected mid-run
+                    self._osf_workers.append(worker)
                     worker.start()
-                    # wait for the worker to finish before continuing (sequential)
-                    worker.wait()
-
-                # after loop, results have been saved by _collect_and_continue
         except Exception as e:
             self.scraper_error(str(e))
 
     def _collect_and_continue(self, df, provider_name, base_filename, search_mode):
-        # merge into master dataframe
+        # stash each provider's frame; merged once when the last provider finishes
         if df is not None and not df.empty:
-            if not hasattr(self, "all_results") or self.all_results is None:
-                self.all_results = df
-            else:
-                self.all_results = pd.concat([self.all_results, df], ignore_index=True)
+            self._result_frames.append(df)
             self.feedback_text.append(f"✅ {len(df)} results from {provider_name}")
 
-        # if this method is invoked after the last provider, save file
-        # Note: we don't know which provider is last here, so caller saves after loop in run_scraper.
-        # Save is handled after run loop: do quick check and save if present
-        if hasattr(self, "all_results") and not self.all_results.empty:
-            filename = os.path.join("data", f"{base_filename}_{provider_name}_{'OSF_API' if self.standard_radio.isChecked() else 'weblike'}.csv")
-            unique = unique_filename(filename)
-            self.all_results.to_csv(unique, index=False)
-            msg = f"\nSearch complete. {len(self.all_results)} preprints saved to '{unique}'"
-            self.feedback_text.append(msg)
-            logging.info(msg)
-            QMessageBox.information(self, "Search Complete", f"Successfully collected {len(self.all_results)} preprints.\n\nFile saved as: {unique}\nLog file: {self.log_filename}")
-            # reset UI
+        self._pending_providers -= 1
+        if self._pending_providers <= 0:
+            self._osf_workers = []
+            self._finalize_osf_results(base_filename)
+
+    def _provider_failed(self, error_msg, provider_name, base_filename):
+        # a failed provider still counts down; otherwise the frames already
+        # collected from the successful ones would never be merged and saved
+        logging.error(f"Search failed on provider={provider_name}, error={error_msg}")
+        self.feedback_text.append(f"\n❌ {provider_name} failed: {error_msg}\n")
+        self._pending_providers -= 1
+        if self._pending_providers <= 0:
+            self._osf_workers = []
+            self._finalize_osf_results(base_filename)
+
+    def _finalize_osf_results(self, base_filename):
+        # pandas is deliberately not imported at module level: it costs several
+        # hundred ms at startup and is only needed once results come back
+        import pandas as pd
+
+        if not self._result_frames:
+            self.feedback_text.append("\n❌ No preprints found.\n")
+            QMessageBox.warning(self, "No Results", "No preprints were found matching your criteria.")
             self._reset_run_button()
+            return
+
+        all_results = pd.concat(self._result_frames, ignore_index=True, copy=False)
+        self._result_frames = []
+        search_mode = "OSF_API" if self.standard_radio.isChecked() else "weblike"
+        filename = os.path.join("data", f"{base_filename}_{search_mode}.csv")
+        self._save_results_async(all_results, filename)
 
     def _reset_run_button(self):
         self.run_button.setEnabled(True)
         self.run_button.setText("Start Search")
-        self.run_button.setIcon(QIcon())
+        self.run_button.setIcon(self._NULL_ICON)
         self.abort_button.setEnabled(False)
 
     def abort_scraper(self):
         logging.warning(f"Search aborted on server={self.current_server}")
-        if self.scraper_thread:
+        if self.scraper_thread or getattr(self, "_osf_workers", None):
             self.feedback_text.append("\n⚠️ Aborting search...\n")
-            self.scraper_thread.abort()
+            if self.scraper_thread:
+                self.scraper_thread.abort()
+            for worker in getattr(self, "_osf_workers", []):
+                worker.abort()
             self.abort_button.setEnabled(False)
         self._reset_run_button()
 
+    def clear_response_cache(self):
+        removed = clear_cache()
+        msg = f"Cleared {removed} cached response(s)."
+        self.feedback_text.append(msg)
+        logging.info(msg)
+
     def update_progress(self, message):
         self.feedback_text.append(message)
         logging.info(message)
@@ -644,13 +696,25 @@ class OASISWidget(QWidget):
             search_mode = "OSF_API" if self.standard_radio.isChecked() else "weblike"
             filename = os.path.join("data", f"{base_filename}_{server_name}_{search_mode}.csv")
 
+        self._save_results_async(df, filename)
+
+    def _save_results_async(self, df, filename):
+        # CSV serialization happens in a worker thread: a large frame would
+        # otherwise block the event loop for seconds
+        from .scrapers.threads import CSVWriterThread
+
         unique = unique_filename(filename)
-        df.to_csv(unique, index=False)
+        self._csv_writer = CSVWriterThread(df, unique)
+        self._csv_writer.done.connect(lambda path, count=len(df): self._csv_saved(count, path))
+        self._csv_writer.error.connect(self.scraper_error)
+        self._csv_writer.start()
 
-        msg = f"\nSearch complete. {len(df)} preprints saved to '{unique}'"
+    def _csv_saved(self, count, path):
+        msg = f"\nSearch complete. {count} preprints saved to '{path}'"
         self.feedback_text.append(msg)
         logging.info(msg)
-        QMessageBox.information(self, "Search Complete", f"Successfully collected {len(df)} preprints.\n\nFile saved as: {unique}\nLog file: {self.log_filename}")
+        QMessageBox.information(self, "Search Complete", f"Successfully collected {count} preprints.\n\nFile saved as: {path}\nLog file: {self.log_filename}")
+        self._reset_run_button()
 
     def scraper_error(self, error_msg):
         logging.error(f"Search failed on server={self.current_server}, error={error_msg}")
@@ -2,26 +2,101 @@
 
 import os
 import time
+import json
 import random
+import hashlib
 import logging
+import asyncio
 import httpx
 
 from .config import POLITENESS_CONFIG
 
+try:
+    # optional C parser, 2-5x faster than stdlib json on large API payloads
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # optional; enables Arrow-backed string columns and the C++ CSV writer
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# disk-backed response cache; OSF metadata is effectively stable day-to-day,
+# so repeat queries within the TTL skip the network entirely
+CACHE_DIR = ".oasis_cache"
+CACHE_TTL = 86400  # 24 hours
+
+
+def _cache_path(key):
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+
+def cache_get(key):
+    """Return the cached JSON payload for key, or None if missing/stale."""
+    path = _cache_path(key)
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL:
+            with open(path, "rb") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def cache_put(key, payload):
+    """Store a JSON-serializable payload under key (atomic via os.replace)."""
+    path = _cache_path(key)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logging.warning(f"Could not write response cache entry: {e}")
+
+
+def clear_cache():
+    """Delete all cached responses. Returns the number of entries removed."""
+    removed = 0
+    try:
+        for entry in os.scandir(CACHE_DIR):
+            if entry.name.endswith(".json"):
+                os.remove(entry.path)
+                removed += 1
+    except OSError:
+        pass
+    return removed
+
 def unique_filename(path):
     """If path exists, append _1, _2, ... before extension."""
-    base, ext = os.path.splitext(path)
+    dirpath = os.path.dirname(path) or "."
+    # one directory snapshot instead of a stat syscall per candidate name
+    try:
+        existing = {entry.name for entry in os.scandir(dirpath)}
+    except OSError:
+        return path
+    name = os.path.basename(path)
+    if name not in existing:
+        return path
+    stem, ext = os.path.splitext(name)
     counter = 1
-    new = path
-    while os.path.exists(new):
-        new = f"{base}_{counter}{ext}"
+    while f"{stem}_{counter}{ext}" in existing:
         counter += 1
-    return new
+    return os.path.join(dirpath, f"{stem}_{counter}{ext}")
+
+
+# transient statuses worth retrying with backoff: rate limiting plus the
+# gateway errors OSF/share.osf intermittently return under load
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
 
 
 def safe_request(method, url, client=None, retries=4, backoff_factor=2, politeness_delay=0.5, **kwargs):
     """
-    Perform an HTTP request with retry/backoff for 429 and basic RequestError handling.
+    Perform an HTTP request with retry/backoff for 429/5xx and basic RequestError handling.
     - client: httpx.Client instance (optional)
     """
     attempt = 0
@@ -32,10 +107,10 @@ def safe_request(method, url, client=None, retries=4, backoff_factor=2, politene
             else:
                 res = httpx.request(method, url, **kwargs)
 
-            # handle 429 / rate-limit
-            if res.status_code == 429:
+            # handle rate-limit / transient gateway errors
+            if res.status_code in RETRY_STATUSES:
                 wait = (backoff_factor ** attempt) + random.uniform(0, 1)
-                logging.warning(f"429 received for {url}. Backing off {wait:.1f}s (attempt {attempt + 1}/{retries}).")
+                logging.warning(f"{res.status_code} received for {url}. Backing off {wait:.1f}s (attempt {attempt + 1}/{retries}).")
                 time.sleep(wait)
                 attempt += 1
                 if attempt >= retries:
@@ -58,3 +133,49 @@ def safe_request(method, url, client=None, retries=4, backoff_factor=2, politene
             attempt += 1
             if attempt >= retries:
                 raise
+
+
+async def safe_request_async(method, url, client, retries=4, backoff_factor=2, politeness_delay=0.5, limiter=None, **kwargs):
+    """
+    Async counterpart of safe_request for use with httpx.AsyncClient.
+    Same retry/backoff behaviour for 429 and RequestError, but sleeps
+    cooperatively so concurrent requests are not blocked.
+    - limiter: optional aiolimiter.AsyncLimiter; when given it paces the
+      average request rate instead of the post-request politeness sleep,
+      so concurrent requests are not serialized behind each other.
+    """
+    attempt = 0
+    while True:
+        try:
+            if limiter is not None:
+                async with limiter:
+                    res = await client.request(method, url, **kwargs)
+            else:
+                res = await client.request(method, url, **kwargs)
+
+            # handle rate-limit / transient gateway errors
+            if res.status_code in RETRY_STATUSES:
+                wait = (backoff_factor ** attempt) + random.uniform(0, 1)
+                logging.warning(f"{res.status_code} received for {url}. Backing off {wait:.1f}s (attempt {attempt + 1}/{retries}).")
+                await asyncio.sleep(wait)
+                attempt += 1
+                if attempt >= retries:
+                    res.raise_for_status()
+                continue
+
+            res.raise_for_status()
+
+            # politeness delay after successful request (token bucket replaces it)
+            if limiter is None and politeness_delay and politeness_delay > 0:
+                await asyncio.sleep(politeness_delay)
+
+            return res
+
+        except httpx.RequestError as e:
+            # network-level failure
+            wait = (backoff_factor ** attempt) + random.uniform(0, 1)
+            logging.warning(f"Request error: {e}. Retrying in {wait:.1f}s (attempt {attempt + 1}/{retries}).")
+            await asyncio.sleep(wait)
+            attempt += 1
+            if attempt >= retries:
+                raise
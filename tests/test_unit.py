@@ -1,6 +1,9 @@
 # test_unit.py
+import os
+import time
 import pytest
 from OASIS import ElasticPreprints, safe_request
+from OASIS import utils
 
 def test_normalize_query():
     ep = ElasticPreprints(provider="psyarxiv")
@@ -20,3 +23,44 @@ def test_safe_request_success(monkeypatch):
     monkeypatch.setattr("httpx.request", dummy_request)
     res = safe_request("GET", "http://test.com")
     assert res.text == "OK"
+
+def test_safe_request_retries_transient(monkeypatch):
+    calls = []
+
+    class DummyRes:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.text = "OK"
+        def raise_for_status(self): return
+
+    def dummy_request(method, url, **kwargs):
+        calls.append(url)
+        # two transient gateway errors, then success
+        return DummyRes(503 if len(calls) < 3 else 200)
+
+    monkeypatch.setattr("httpx.request", dummy_request)
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    res = safe_request("GET", "http://test.com", politeness_delay=0)
+    assert res.status_code == 200
+    assert len(calls) == 3
+
+def test_unique_filename(tmp_path):
+    path = str(tmp_path / "out.csv")
+    assert utils.unique_filename(path) == path
+    (tmp_path / "out.csv").touch()
+    assert utils.unique_filename(path) == str(tmp_path / "out_1.csv")
+    (tmp_path / "out_1.csv").touch()
+    assert utils.unique_filename(path) == str(tmp_path / "out_2.csv")
+    # missing directory falls back to the original path
+    missing = str(tmp_path / "nope" / "out.csv")
+    assert utils.unique_filename(missing) == missing
+
+def test_cache_roundtrip_and_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "CACHE_DIR", str(tmp_path / "cache"))
+    assert utils.cache_get("key") is None
+    utils.cache_put("key", {"a": 1})
+    assert utils.cache_get("key") == {"a": 1}
+    # backdate the entry past the TTL; stale entries read as misses
+    stale = time.time() - utils.CACHE_TTL - 1
+    os.utime(utils._cache_path("key"), (stale, stale))
+    assert utils.cache_get("key") is None